@@ -11,12 +11,10 @@ Example:
     >>> rt = Raytracer(box, deflection=0.1)
     >>> result = rt.cast_ray(origin=(5, 5, 100), direction=(0, 0, -1))
     >>> print(result)
-    {'hit': True, 'point': array([5., 5., 10.]), 'normal': array([0., 0., 1.]), ...}
+    Hit(hit=True, point=array([ 5.,  5., 10.]), normal=array([0., 0., 1.]), ...)
 """
 import os
 import sys
-import ctypes
-import glob
 
 __version__ = "1.1.0"
 __author__ = "Andrea Pozzetti"
@@ -31,31 +29,47 @@ if sys.platform == 'win32' and os.path.isdir(_libs_dir):
         os.add_dll_directory(_libs_dir)
     os.environ['PATH'] = _libs_dir + os.pathsep + os.environ.get('PATH', '')
 
-elif sys.platform == 'linux' and os.path.isdir(_libs_dir):
-    # Linux: Preload bundled shared libraries
-    for lib_name in ['libTKernel.so', 'libTKMath.so', 'libTKG2d.so', 'libTKG3d.so',
-                     'libTKGeomBase.so', 'libTKBRep.so', 'libTKGeomAlgo.so',
-                     'libTKTopAlgo.so', 'libTKMesh.so']:
-        lib_path = os.path.join(_libs_dir, lib_name)
-        if os.path.exists(lib_path):
-            try:
-                ctypes.CDLL(lib_path, mode=ctypes.RTLD_GLOBAL)
-            except OSError:
-                pass
 
-elif sys.platform == 'darwin' and os.path.isdir(_libs_dir):
-    # macOS: Preload bundled shared libraries (use glob for versioned names)
+def _preload_bundled_libs():
+    """Load the bundled OCCT libraries with RTLD_GLOBAL (Linux/macOS)."""
+    import ctypes
+
+    # One directory scan, then membership tests per library
+    try:
+        with os.scandir(_libs_dir) as it:
+            entries = {entry.name: entry.path for entry in it}
+    except OSError:
+        return
+
     for lib_base in ['libTKernel', 'libTKMath', 'libTKG2d', 'libTKG3d',
                      'libTKGeomBase', 'libTKBRep', 'libTKGeomAlgo',
                      'libTKTopAlgo', 'libTKMesh']:
-        # Match libTKernel.dylib, libTKernel.7.dylib, libTKernel.7.8.1.dylib, etc.
-        matches = glob.glob(os.path.join(_libs_dir, lib_base + '*.dylib'))
-        for lib_path in matches:
+        if sys.platform == 'darwin':
+            # Match libTKernel.dylib, libTKernel.7.dylib, libTKernel.7.8.1.dylib, etc.
+            lib_paths = [path for name, path in entries.items()
+                         if name.startswith(lib_base) and name.endswith('.dylib')]
+        else:
+            lib_path = entries.get(lib_base + '.so')
+            lib_paths = [lib_path] if lib_path else []
+
+        for lib_path in lib_paths:
             try:
                 ctypes.CDLL(lib_path, mode=ctypes.RTLD_GLOBAL)
             except OSError:
                 pass
 
-from .raytracer import Raytracer, Backend
 
-__all__ = ["Raytracer", "Backend"]
+# Linux/macOS: the extension finds occt_rt/libs through its RPATH
+# ($ORIGIN/libs, @loader_path/libs). Only preload the bundled libraries
+# one by one if that fails, e.g. for an extension built without the RPATH.
+try:
+    from . import _OCCTRT
+except ImportError:
+    if sys.platform == 'win32':
+        raise
+    _preload_bundled_libs()
+    from . import _OCCTRT
+
+from .raytracer import Raytracer, Backend, Hit, clear_cache
+
+__all__ = ["Raytracer", "Backend", "Hit", "clear_cache"]
@@ -5,8 +5,10 @@ This module provides an easy-to-use API for ray-surface intersection
 that integrates seamlessly with pythonocc-core.
 """
 
+import warnings
 from enum import Enum
-from typing import Dict, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple, Union
 import numpy as np
 
 # Import the SWIG-generated bindings
@@ -25,6 +27,8 @@ class Backend(Enum):
 # Map string names to enum values
 _BACKEND_MAP = {
     "occt": _OCCTRT.BRepIntCurveSurface_BVHBackend_OCCT_BVH,
+    # rtcIntersect1 already traces one ray through Embree's 8-wide BVH on AVX CPUs,
+    # the recommended traversal for incoherent rays
     "embree": _OCCTRT.BRepIntCurveSurface_BVHBackend_Embree_Scalar,
     "embree_scalar": _OCCTRT.BRepIntCurveSurface_BVHBackend_Embree_Scalar,
     "embree_simd4": _OCCTRT.BRepIntCurveSurface_BVHBackend_Embree_SIMD4,
@@ -34,6 +38,252 @@ _BACKEND_MAP = {
 }
 
 
+class Hit(NamedTuple):
+    """
+    Result of a single ray cast (see Raytracer.cast_ray).
+
+    Besides attribute and index access, a Hit reads like the dict cast_ray
+    used to return: string keys, `in`, get(), keys() and items() only see
+    the fields that dict had, i.e. just 'hit' on a miss, and no None fields
+    (such as curvatures that were not requested) on a hit.
+    """
+
+    hit: bool
+    point: Optional[np.ndarray]
+    normal: Optional[np.ndarray]
+    uv: Optional[np.ndarray]
+    w: float
+    face_id: int
+    gauss_curvature: Optional[float] = None
+    mean_curvature: Optional[float] = None
+    min_curvature: Optional[float] = None
+    max_curvature: Optional[float] = None
+
+    def __getitem__(self, key):
+        # Keep dict-style access (hit['point']) working alongside indexing
+        if isinstance(key, str):
+            if key not in self:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        # Key membership like the old dict, not tuple membership
+        if key == "hit":
+            return True
+        return (
+            self.hit
+            and isinstance(key, str)
+            and key in self._fields
+            and getattr(self, key) is not None
+        )
+
+    def get(self, key: str, default=None):
+        """Value of the named field, or default where the old dict had no key."""
+        return getattr(self, key) if key in self else default
+
+    def keys(self):
+        """Names of the fields the old dict would have had."""
+        return self.asdict().keys()
+
+    def items(self):
+        """(name, value) pairs of the fields the old dict would have had."""
+        return self.asdict().items()
+
+    def asdict(self) -> Dict:
+        """Dictionary form, as cast_ray returned before Hit was introduced."""
+        if not self.hit:
+            return {"hit": False}
+        return {key: value for key, value in self._asdict().items() if value is not None}
+
+
+# View axis -> (image x column, image y column, depth column, ray direction)
+_AXIS_TABLE = {
+    "z": (0, 1, 2, (0.0, 0.0, -1.0)),  # Top-down view
+    "y": (0, 2, 1, (0.0, -1.0, 0.0)),  # Front view
+    "x": (1, 2, 0, (-1.0, 0.0, 0.0)),  # Side view
+}
+
+# Shared result for rays that hit nothing
+_MISS = Hit(False, None, None, None, 0.0, -1)
+
+# Relative float32 rounding error of Embree's ray and vertex coordinates
+_FLOAT32_EPS = float(np.finfo(np.float32).eps)
+
+
+def _alloc_ray_outputs(n_rays: int, output_mode: str) -> Dict[str, np.ndarray]:
+    """Allocate the result arrays cast_rays returns for output_mode."""
+    out = {
+        "hits": np.empty(n_rays, dtype=np.bool_),
+        "points": np.empty((n_rays, 3), dtype=np.float64),
+        "face_ids": np.empty(n_rays, dtype=np.int32),
+    }
+    if output_mode in ("normals", "full"):
+        out["normals"] = np.empty((n_rays, 3), dtype=np.float64)
+        out["uvs"] = np.empty((n_rays, 2), dtype=np.float64)
+        out["ws"] = np.empty(n_rays, dtype=np.float64)
+    if output_mode == "full":
+        for key in ("gauss_curvatures", "mean_curvatures", "min_curvatures", "max_curvatures"):
+            out[key] = np.empty(n_rays, dtype=np.float64)
+    return out
+
+
+def _as_ray_array(rays) -> np.ndarray:
+    """Return rays as float32 if already float32, otherwise as float64."""
+    rays = np.asarray(rays)
+    if rays.dtype != np.float32:
+        rays = rays.astype(np.float64, copy=False)
+    return rays
+
+
+def _is_tessellated(shape, deflection: float) -> bool:
+    """Check that every face already has a triangulation at least as fine as deflection."""
+    from OCC.Core.BRep import BRep_Tool
+    from OCC.Core.TopAbs import TopAbs_FACE
+    from OCC.Core.TopExp import TopExp_Explorer
+    from OCC.Core.TopLoc import TopLoc_Location
+    from OCC.Core.TopoDS import topods
+
+    explorer = TopExp_Explorer(shape, TopAbs_FACE)
+    while explorer.More():
+        face = topods.Face(explorer.Current())
+        triangulation = BRep_Tool.Triangulation(face, TopLoc_Location())
+        if triangulation is None or triangulation.Deflection() > deflection:
+            return False
+        explorer.Next()
+    return True
+
+
+def _shape_extent(shape) -> float:
+    """Largest absolute coordinate of shape's bounding box (0.0 if unknown)."""
+    try:
+        from OCC.Core.Bnd import Bnd_Box
+        from OCC.Core.BRepBndLib import brepbndlib
+    except ImportError:
+        return 0.0
+
+    box = Bnd_Box()
+    brepbndlib.Add(shape, box)
+    if box.IsVoid():
+        return 0.0
+    return max(abs(value) for value in box.Get())
+
+
+def _is_hashable(obj) -> bool:
+    """Check whether obj can be used as a cache key."""
+    try:
+        hash(obj)
+    except TypeError:
+        return False
+    return True
+
+
+def _backend_name(backend: Union[str, Backend]) -> str:
+    """Validate a backend given as string or Backend and return its name."""
+    if isinstance(backend, Backend):
+        backend = backend.value
+    if backend not in _BACKEND_MAP:
+        raise ValueError(
+            f"Unknown backend '{backend}'. "
+            f"Valid options: {list(_BACKEND_MAP.keys())}"
+        )
+    return backend
+
+
+def _build_bvh_uncached(
+    shape,
+    tolerance: float,
+    deflection: float,
+    backend,
+    openmp: bool,
+    force_remesh: bool = False,
+):
+    """
+    Tessellate shape and build a configured BRepIntCurveSurface_InterBVH.
+
+    backend is the BRepIntCurveSurface_BVHBackend value, not the user-facing
+    name.
+    """
+    # Tessellate the shape if not already done
+    try:
+        from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+        from OCC.Core.BRepTools import breptools
+
+        if force_remesh:
+            # BRepMesh keeps any triangulation already finer than deflection
+            breptools.Clean(shape)
+        if force_remesh or not _is_tessellated(shape, deflection):
+            BRepMesh_IncrementalMesh(shape, deflection)
+    except ImportError:
+        # pythonocc not available, assume shape is already tessellated
+        pass
+
+    # Create the C++ raytracer
+    rt = _OCCTRT.BRepIntCurveSurface_InterBVH()
+    rt.SetBackend(backend)
+    rt.SetUseOpenMP(openmp)
+
+    # Load shape and build BVH (use load_shape for pythonocc compatibility)
+    rt.load_shape(shape, tolerance, deflection)
+    return rt
+
+
+@lru_cache(maxsize=8)
+def _build_bvh(shape, tolerance: float, deflection: float, backend, openmp: bool):
+    """
+    Memoized _build_bvh_uncached without force_remesh.
+
+    Repeated Raytracer construction on the same shape skips meshing and the
+    BVH build; Raytracers created with identical settings, or with aliases
+    of one backend, share the instance.
+    """
+    return _build_bvh_uncached(shape, tolerance, deflection, backend, openmp)
+
+
+def _get_build(
+    shape,
+    tolerance: float,
+    deflection: float,
+    backend,
+    openmp: bool,
+    force_remesh: bool = False,
+):
+    """
+    BVH build for shape, from the cache where possible.
+
+    force_remesh and unhashable shapes bypass the cache; every other call
+    uses the same cache key, however the caller passes its arguments.
+    """
+    if force_remesh or not _is_hashable(shape):
+        return _build_bvh_uncached(shape, tolerance, deflection, backend, openmp, force_remesh)
+    return _build_bvh(shape, tolerance, deflection, backend, openmp)
+
+
+def clear_cache() -> None:
+    """
+    Release all cached BVH builds.
+
+    The cache keeps up to 8 shapes and their BVHs alive after the Raytracers
+    using them are deleted. Existing Raytracers keep working on their builds.
+    """
+    _build_bvh.cache_clear()
+
+
+def _cast_rays_fast(rt, origins, directions, out, output_mode, coherent=False):
+    """
+    Cast rays into out without Python-side validation.
+
+    For internal callers whose buffers already are C-contiguous (N, 3)
+    float32/float64 arrays and whose output_mode is already checked.
+    coherent traces every ray along directions[0] without checking that
+    the directions actually agree, so it is not exposed on Raytracer.
+    """
+    assert origins.ndim == 2 and origins.shape[1] == 3 and origins.flags.c_contiguous
+    assert directions.shape == origins.shape and directions.flags.c_contiguous
+    assert output_mode in ("basic", "normals", "full")
+    return rt.cast_rays_numpy_into(origins, directions, out, output_mode, coherent)
+
+
 class Raytracer:
     """
     High-performance BVH-accelerated ray-surface intersection.
@@ -51,12 +301,30 @@ class Raytracer:
 
     Args:
         shape: A TopoDS_Shape from pythonocc (must be tessellated or will be auto-tessellated)
-        tolerance: Intersection tolerance (default: 0.001)
+        tolerance: Intersection tolerance (default: 0.001). On Embree backends, rays
+            or shapes too far from the origin for float32 to meet it are answered
+            by the OCCT backend
         deflection: Tessellation deflection - smaller = finer mesh (default: 0.1)
         backend: BVH backend - 'occt', 'embree', 'embree_simd4', 'embree_simd8' (default: 'occt')
         openmp: Enable OpenMP parallelization for batch operations (default: True)
+        force_remesh: Discard the shape's triangulation and re-tessellate at
+            deflection, even if it is already fine enough (default: False)
     """
 
+    __slots__ = (
+        "_rt",
+        "_shape",
+        "_tolerance",
+        "_deflection",
+        "_backend",
+        "_openmp",
+        "_one_origin",
+        "_one_dir",
+        "_render_scratch",
+        "_shape_extent",
+        "__weakref__",  # Raytracers may be cached weakly by callers
+    )
+
     def __init__(
         self,
         shape,
@@ -64,41 +332,34 @@ class Raytracer:
         deflection: float = 0.1,
         backend: Union[str, Backend] = "occt",
         openmp: bool = True,
+        force_remesh: bool = False,
     ):
-        # Tessellate the shape if not already done
-        try:
-            from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+        backend = _backend_name(backend)
 
-            BRepMesh_IncrementalMesh(shape, deflection)
-        except ImportError:
-            # pythonocc not available, assume shape is already tessellated
-            pass
-
-        # Create the C++ raytracer
-        self._rt = _OCCTRT.BRepIntCurveSurface_InterBVH()
-
-        # Set backend
-        if isinstance(backend, Backend):
-            backend = backend.value
-        if backend not in _BACKEND_MAP:
-            raise ValueError(
-                f"Unknown backend '{backend}'. "
-                f"Valid options: {list(_BACKEND_MAP.keys())}"
-            )
-        self._rt.SetBackend(_BACKEND_MAP[backend])
-
-        # Set OpenMP
-        self._rt.SetUseOpenMP(openmp)
-
-        # Load shape and build BVH (use load_shape for pythonocc compatibility)
-        self._rt.load_shape(shape, tolerance, deflection)
+        # Tessellate and build the BVH, reusing a cached build for the same
+        # shape and settings
+        self._rt = _get_build(
+            shape, tolerance, deflection, _BACKEND_MAP[backend], openmp, force_remesh
+        )
 
         # Store config
+        self._shape = shape
         self._tolerance = tolerance
         self._deflection = deflection
         self._backend = backend
         self._openmp = openmp
 
+        # Embree stores vertices in float32 too, so far-off geometry counts
+        # towards the precision check as much as far-off rays
+        self._shape_extent = _shape_extent(shape)
+
+        # Reusable 1x3 buffers so cast_ray can go through the batch entry point
+        self._one_origin = np.empty((1, 3), dtype=np.float64)
+        self._one_dir = np.empty((1, 3), dtype=np.float64)
+
+        # (layout key, origins, directions, results) reused by render_orthographic
+        self._render_scratch = None
+
     @property
     def is_loaded(self) -> bool:
         """Check if shape has been loaded and BVH built."""
@@ -119,6 +380,49 @@ class Raytracer:
         """Whether OpenMP parallelization is enabled."""
         return self._rt.GetUseOpenMP()
 
+    def set_backend(self, backend: Union[str, Backend]) -> None:
+        """
+        Switch this raytracer to another BVH backend.
+
+        The backend's build for this shape comes from the BVH cache, so
+        switching back and forth between backends only builds each one once.
+        Other Raytracers sharing the previous build are not affected.
+
+        Args:
+            backend: BVH backend - 'occt', 'embree', 'embree_simd4', 'embree_simd8'
+        """
+        backend = _backend_name(backend)
+        if _BACKEND_MAP[backend] != _BACKEND_MAP[self._backend]:
+            self._rt = _get_build(
+                self._shape, self._tolerance, self._deflection, _BACKEND_MAP[backend], self._openmp
+            )
+        self._backend = backend
+
+    def _rt_for_extent(self, extent: float, stacklevel: int = 3):
+        """
+        BVH to query for rays whose coordinates reach up to extent.
+
+        Embree traverses in float32, which quantizes ray and vertex
+        coordinates to about extent * eps32, extent being the larger of the
+        rays' and the shape's. When that exceeds the intersection tolerance,
+        warn and answer from the double-precision OCCT build of the shape.
+        stacklevel is passed to warnings.warn to point at the public caller.
+        """
+        extent = max(extent, self._shape_extent)
+        if extent * _FLOAT32_EPS <= self._tolerance:
+            return self._rt
+
+        warnings.warn(
+            f"Ray or shape coordinates up to {extent:g} exceed float32 precision for "
+            f"tolerance {self._tolerance:g} on backend '{self._backend}'; "
+            f"using the 'occt' backend for this call",
+            RuntimeWarning,
+            stacklevel=stacklevel,
+        )
+        return _get_build(
+            self._shape, self._tolerance, self._deflection, _BACKEND_MAP["occt"], self._openmp
+        )
+
     def cast_ray(
         self,
         origin: Tuple[float, float, float],
@@ -126,7 +430,8 @@ class Raytracer:
         min_dist: float = 0.0,
         max_dist: float = 1e308,
         include_curvatures: bool = False,
-    ) -> Dict:
+        legacy: bool = False,
+    ) -> Hit:
         """
         Cast a single ray and return hit information.
 
@@ -136,51 +441,134 @@ class Raytracer:
             min_dist: Minimum distance along ray to consider (default: 0)
             max_dist: Maximum distance along ray to consider (default: infinity)
             include_curvatures: Whether to include curvature data (default: False)
+            legacy: Force the per-ray gp_Lin/Perform path (default: False).
+                This path is always used when min_dist/max_dist differ from
+                their defaults, since the batch API does not support them.
 
         Returns:
-            Dictionary with hit information:
+            Hit named tuple (also usable like the old dict: hit['point'],
+            'point' in hit, hit.get(...); see Hit):
             - hit (bool): Whether the ray hit anything
-            - point (ndarray[3]): Hit point coordinates (if hit)
-            - normal (ndarray[3]): Surface normal at hit (if hit)
-            - uv (ndarray[2]): UV parameters on surface (if hit)
-            - w (float): Distance along ray (if hit)
-            - face_id (int): Index of hit face (if hit)
+            - point (ndarray[3]): Hit point coordinates (None on miss)
+            - normal (ndarray[3]): Surface normal at hit (None on miss)
+            - uv (ndarray[2]): UV parameters on surface (None on miss)
+            - w (float): Distance along ray (0.0 on miss)
+            - face_id (int): Index of hit face (-1 on miss)
             - gauss_curvature (float): Gaussian curvature (if include_curvatures)
             - mean_curvature (float): Mean curvature (if include_curvatures)
             - min_curvature (float): Min principal curvature (if include_curvatures)
             - max_curvature (float): Max principal curvature (if include_curvatures)
         """
+        rt = self._rt
+        if self._backend.startswith("embree"):
+            extent = max(abs(origin[0]), abs(origin[1]), abs(origin[2]))
+            if max_dist < 1e308:
+                extent += max_dist
+            rt = self._rt_for_extent(extent)
+
+        if not legacy and min_dist == 0.0 and max_dist == 1e308:
+            return self._cast_ray_batch(rt, origin, direction, include_curvatures)
+
         # Create gp_Lin
         pnt = _OCCTRT.gp_Pnt(origin[0], origin[1], origin[2])
         dir_ = _OCCTRT.gp_Dir(direction[0], direction[1], direction[2])
         ray = _OCCTRT.gp_Lin(pnt, dir_)
 
         # Perform intersection
-        self._rt.Perform(ray, min_dist, max_dist)
+        rt.Perform(ray, min_dist, max_dist)
 
-        if not self._rt.IsDone() or self._rt.NbPnt() == 0:
-            return {"hit": False}
+        if not rt.IsDone() or rt.NbPnt() == 0:
+            return _MISS
 
         # Extract results (1-based indexing in C++ API)
-        hit_pnt = self._rt.Pnt(1)
-        normal = self._rt.Normal(1)
-
-        result = {
-            "hit": True,
-            "point": np.array([hit_pnt.X(), hit_pnt.Y(), hit_pnt.Z()]),
-            "normal": np.array([normal.X(), normal.Y(), normal.Z()]),
-            "uv": np.array([self._rt.U(1), self._rt.V(1)]),
-            "w": self._rt.W(1),
-            "face_id": self._rt.FaceIndex(1),
-        }
+        hit_pnt = rt.Pnt(1)
+        normal = rt.Normal(1)
+
+        hit = Hit(
+            True,
+            np.array([hit_pnt.X(), hit_pnt.Y(), hit_pnt.Z()]),
+            np.array([normal.X(), normal.Y(), normal.Z()]),
+            np.array([rt.U(1), rt.V(1)]),
+            rt.W(1),
+            rt.FaceIndex(1),
+        )
 
         if include_curvatures:
-            result["gauss_curvature"] = self._rt.GaussianCurvature(1)
-            result["mean_curvature"] = self._rt.MeanCurvature(1)
-            result["min_curvature"] = self._rt.MinCurvature(1)
-            result["max_curvature"] = self._rt.MaxCurvature(1)
+            hit = hit._replace(
+                gauss_curvature=rt.GaussianCurvature(1),
+                mean_curvature=rt.MeanCurvature(1),
+                min_curvature=rt.MinCurvature(1),
+                max_curvature=rt.MaxCurvature(1),
+            )
+
+        return hit
+
+    def _cast_ray_batch(self, rt, origin, direction, include_curvatures: bool) -> Hit:
+        """Single-ray query through cast_rays_numpy using the 1x3 scratch buffers."""
+        one_origin = self._one_origin
+        one_dir = self._one_dir
+        one_origin[0, 0] = origin[0]
+        one_origin[0, 1] = origin[1]
+        one_origin[0, 2] = origin[2]
+        one_dir[0, 0] = direction[0]
+        one_dir[0, 1] = direction[1]
+        one_dir[0, 2] = direction[2]
+
+        results = rt.cast_rays_numpy(
+            one_origin, one_dir, "full" if include_curvatures else "normals"
+        )
+
+        if not results["hits"][0]:
+            return _MISS
 
-        return result
+        if include_curvatures:
+            return Hit(
+                True,
+                results["points"][0],
+                results["normals"][0],
+                results["uvs"][0],
+                float(results["ws"][0]),
+                int(results["face_ids"][0]),
+                float(results["gauss_curvatures"][0]),
+                float(results["mean_curvatures"][0]),
+                float(results["min_curvatures"][0]),
+                float(results["max_curvatures"][0]),
+            )
+
+        return Hit(
+            True,
+            results["points"][0],
+            results["normals"][0],
+            results["uvs"][0],
+            float(results["ws"][0]),
+            int(results["face_ids"][0]),
+        )
+
+    def _prepare_rays(self, origins, directions, output_mode: str):
+        """
+        Validate batch ray inputs shared by cast_rays and cast_rays_into.
+
+        Returns (rt, origins, directions): the BVH to query, and the rays as
+        (N, 3) float32 or float64 arrays.
+        """
+        origins = _as_ray_array(origins)
+        directions = _as_ray_array(directions)
+
+        if origins.ndim == 1:
+            origins = origins.reshape(1, 3)
+        if directions.ndim == 1:
+            directions = directions.reshape(1, 3)
+
+        if output_mode not in ("basic", "normals", "full"):
+            raise ValueError(f"output_mode must be 'basic', 'normals', or 'full', got '{output_mode}'")
+
+        rt = self._rt
+        if self._backend.startswith("embree") and origins.size:
+            # max/-min rather than abs().max() to avoid an N x 3 temporary
+            extent = float(max(origins.max(), -origins.min()))
+            rt = self._rt_for_extent(extent, stacklevel=4)
+
+        return rt, origins, directions
 
     def cast_rays(
         self,
@@ -192,8 +580,9 @@ class Raytracer:
         Cast multiple rays in batch (uses OpenMP if enabled).
 
         Args:
-            origins: Nx3 array of ray origins
-            directions: Nx3 array of ray directions
+            origins: Nx3 array of ray origins (float32 is passed through as-is,
+                other dtypes are converted to float64)
+            directions: Nx3 array of ray directions (same dtype rules)
             output_mode: What to compute - 'basic', 'normals', or 'full'
                 - 'basic': hits, points, face_ids (fastest)
                 - 'normals': basic + surface normals
@@ -205,23 +594,50 @@ class Raytracer:
             - points (float[N,3]): Hit points
             - face_ids (int[N]): Face indices (-1 if no hit)
             - normals (float[N,3]): Surface normals (if output_mode != 'basic')
+            - uvs (float[N,2]): UV parameters on surface (if output_mode != 'basic')
+            - ws (float[N]): Distance along ray (if output_mode != 'basic')
             - gauss_curvatures (float[N]): Gaussian curvature (if output_mode == 'full')
             - mean_curvatures (float[N]): Mean curvature (if output_mode == 'full')
             - min_curvatures (float[N]): Min principal curvature (if output_mode == 'full')
             - max_curvatures (float[N]): Max principal curvature (if output_mode == 'full')
+
+            The float64 arrays are views into one shared buffer, so keeping
+            any one of them keeps all of them alive (up to 13N doubles in
+            'full' mode). Copy the arrays you keep if you drop the rest.
         """
-        origins = np.asarray(origins, dtype=np.float64)
-        directions = np.asarray(directions, dtype=np.float64)
+        rt, origins, directions = self._prepare_rays(origins, directions, output_mode)
+        return rt.cast_rays_numpy(origins, directions, output_mode)
 
-        if origins.ndim == 1:
-            origins = origins.reshape(1, 3)
-        if directions.ndim == 1:
-            directions = directions.reshape(1, 3)
+    def cast_rays_into(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        out: Optional[Dict[str, np.ndarray]] = None,
+        output_mode: str = "normals",
+    ) -> Dict[str, np.ndarray]:
+        """
+        Cast multiple rays, writing results into preallocated arrays.
 
-        if output_mode not in ("basic", "normals", "full"):
-            raise ValueError(f"output_mode must be 'basic', 'normals', or 'full', got '{output_mode}'")
+        Same as cast_rays, but the result arrays are filled in place, so
+        repeated calls (e.g. one per animation frame) allocate nothing once
+        the buffers exist.
 
-        return self._rt.cast_rays_numpy(origins, directions, output_mode)
+        Args:
+            origins: Nx3 array of ray origins
+            directions: Nx3 array of ray directions
+            out: Dictionary of arrays with the keys, dtypes and sizes cast_rays
+                returns for output_mode; allocated if None
+            output_mode: What to compute - 'basic', 'normals', or 'full'
+
+        Returns:
+            The out dictionary, filled with the results
+        """
+        rt, origins, directions = self._prepare_rays(origins, directions, output_mode)
+
+        if out is None:
+            out = _alloc_ray_outputs(len(origins), output_mode)
+
+        return rt.cast_rays_numpy_into(origins, directions, out, output_mode)
 
     def render_orthographic(
         self,
@@ -234,6 +650,10 @@ class Raytracer:
         """
         Render orthographic depth and normal maps.
 
+        The ray and result buffers (about 160 bytes per pixel in 'full'
+        mode) are kept on the raytracer so repeated renders at the same size
+        reuse them; release them with clear_render_buffers().
+
         Args:
             resolution: (width, height) of output images
             bounds: (xmin, ymin, xmax, ymax) bounding box in view plane
@@ -257,59 +677,65 @@ class Raytracer:
         width, height = resolution
         xmin, ymin, xmax, ymax = bounds
 
+        try:
+            x_idx, y_idx, depth_idx, direction = _AXIS_TABLE[axis.lower()]
+        except KeyError:
+            raise ValueError(f"axis must be 'x', 'y', or 'z', got '{axis}'") from None
+
+        if output_mode not in ("basic", "normals", "full"):
+            raise ValueError(f"output_mode must be 'basic', 'normals', or 'full', got '{output_mode}'")
+
         # Generate ray grid
         xs = np.linspace(xmin, xmax, width)
         ys = np.linspace(ymax, ymin, height)  # Flip Y for image coords
-        xx, yy = np.meshgrid(xs, ys)
 
         n_rays = width * height
 
-        # Set up ray origins and directions based on axis
-        if axis.lower() == "z":
-            # Top-down view (Z axis)
-            zmax = offset  # Assume rays start from above
-            origins = np.column_stack(
-                [xx.ravel(), yy.ravel(), np.full(n_rays, zmax)]
-            )
-            directions = np.tile([0.0, 0.0, -1.0], (n_rays, 1))
-        elif axis.lower() == "y":
-            # Front view (Y axis)
-            origins = np.column_stack(
-                [xx.ravel(), np.full(n_rays, offset), yy.ravel()]
+        # Embree traverses in float32, so its rays are generated as float32
+        # unless the grid is too far out for float32 to meet the tolerance.
+        # Ray and result buffers are kept between calls with the same layout.
+        extent = max(abs(xmin), abs(ymin), abs(xmax), abs(ymax), abs(offset))
+        rt = self._rt
+        ray_dtype = np.float64
+        if self._backend.startswith("embree"):
+            rt = self._rt_for_extent(extent)
+            if rt is self._rt:
+                ray_dtype = np.float32
+        scratch_key = (n_rays, ray_dtype, output_mode)
+        if self._render_scratch is None or self._render_scratch[0] != scratch_key:
+            self._render_scratch = (
+                scratch_key,
+                np.empty((n_rays, 3), dtype=ray_dtype),
+                np.empty((n_rays, 3), dtype=ray_dtype),
+                _alloc_ray_outputs(n_rays, output_mode),
             )
-            directions = np.tile([0.0, -1.0, 0.0], (n_rays, 1))
-        elif axis.lower() == "x":
-            # Side view (X axis)
-            origins = np.column_stack(
-                [np.full(n_rays, offset), xx.ravel(), yy.ravel()]
-            )
-            directions = np.tile([-1.0, 0.0, 0.0], (n_rays, 1))
-        else:
-            raise ValueError(f"axis must be 'x', 'y', or 'z', got '{axis}'")
+        _, origins, directions, results = self._render_scratch
+
+        # (height, width, 3) view over the (N, 3) buffer, with xs broadcast
+        # across rows and ys down columns (no meshgrid)
+        grid = origins.reshape(height, width, 3)
+        grid[:, :, x_idx] = xs
+        grid[:, :, y_idx] = ys[:, None]
+        grid[:, :, depth_idx] = offset  # Rays start from above along the view axis
+        directions[:] = direction
 
-        # Cast rays
-        results = self.cast_rays(origins, directions, output_mode=output_mode)
+        # Cast rays into the scratch buffers (already validated above)
+        _cast_rays_fast(rt, origins, directions, results, output_mode, coherent=True)
 
         # Reshape results to images
         hits = results["hits"].reshape(height, width)
         points = results["points"].reshape(height, width, 3)
         face_ids = results["face_ids"].reshape(height, width)
 
-        # Create depth map (Z coordinate for z-axis view, etc.)
-        if axis.lower() == "z":
-            depth = points[:, :, 2].copy()
-        elif axis.lower() == "y":
-            depth = points[:, :, 1].copy()
-        else:
-            depth = points[:, :, 0].copy()
-
-        # Set NaN where no hit
-        depth[~hits] = np.nan
+        # Create depth map (Z coordinate for z-axis view, etc.): one float32
+        # buffer pre-filled with NaN, hit depths cast in during the copy
+        depth = np.full((height, width), np.nan, dtype=np.float32)
+        np.copyto(depth, points[:, :, depth_idx], casting="same_kind", where=hits)
 
         # Build output dictionary
         output = {
-            "depth": depth.astype(np.float32),
-            "face_ids": face_ids.astype(np.int32),
+            "depth": depth,
+            "face_ids": face_ids.copy(),  # results may be scratch buffers
         }
 
         if output_mode in ("normals", "full"):
@@ -324,6 +750,10 @@ class Raytracer:
 
         return output
 
+    def clear_render_buffers(self) -> None:
+        """Release the buffers render_orthographic keeps between calls."""
+        self._render_scratch = None
+
     def __repr__(self) -> str:
         return (
             f"Raytracer(faces={self.num_faces}, "
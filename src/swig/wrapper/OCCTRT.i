@@ -25,8 +25,261 @@
 
 #include "BRepIntCurveSurface_InterBVH.hxx"
 
+#if defined(__SSE2__) || defined(_M_X64)
+#include <xmmintrin.h>
+#include <pmmintrin.h>
+#define OCCTRT_HAVE_MXCSR
+#endif
+
 #define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
 #include <numpy/arrayobject.h>
+
+/* Contiguous (N, 3) ray buffer: float32 input is kept as-is, anything
+ * else is converted to float64 */
+static PyArrayObject* OCCTRT_RayArray(PyObject* theObj)
+{
+    const int aType = (PyArray_Check(theObj) && PyArray_TYPE((PyArrayObject*)theObj) == NPY_FLOAT32)
+                    ? NPY_FLOAT32 : NPY_FLOAT64;
+    return (PyArrayObject*)PyArray_FROM_OTF(theObj, aType, NPY_ARRAY_IN_ARRAY);
+}
+
+/* Enables MXCSR flush-to-zero / denormals-are-zero for its lifetime and
+ * restores the caller's mode on destruction (no-op on non-x86 targets) */
+class OCCTRT_DenormalGuard {
+public:
+    explicit OCCTRT_DenormalGuard(bool theEnable) : myEnabled(theEnable), myCsr(0) {
+#ifdef OCCTRT_HAVE_MXCSR
+        if (myEnabled) {
+            myCsr = _mm_getcsr();
+            _MM_SET_FLUSH_ZERO_MODE(_MM_FLUSH_ZERO_ON);
+            _MM_SET_DENORMALS_ZERO_MODE(_MM_DENORMALS_ZERO_ON);
+        }
+#endif
+    }
+
+    ~OCCTRT_DenormalGuard() {
+#ifdef OCCTRT_HAVE_MXCSR
+        if (myEnabled) {
+            _mm_setcsr(myCsr);
+        }
+#endif
+    }
+
+private:
+    bool myEnabled;
+    unsigned int myCsr;
+};
+
+/* Contiguous float64 array over theBlock's data starting at theOffset.
+ * The view takes a reference to theBlock as its base object. */
+static PyArrayObject* OCCTRT_BlockView(PyArrayObject* theBlock, npy_intp theOffset,
+                                       int theNd, npy_intp* theDims)
+{
+    double* aData = (double*)PyArray_DATA(theBlock) + theOffset;
+    PyArrayObject* aView = (PyArrayObject*)PyArray_New(&PyArray_Type, theNd, theDims, NPY_FLOAT64,
+                                                       NULL, aData, 0, NPY_ARRAY_CARRAY, NULL);
+    if (!aView) {
+        return NULL;
+    }
+    Py_INCREF(theBlock);
+    if (PyArray_SetBaseObject(aView, (PyObject*)theBlock) < 0) {
+        Py_DECREF(aView);
+        return NULL;
+    }
+    return aView;
+}
+
+/* Read-only coordinate access over a float32 or float64 ray buffer */
+struct OCCTRT_RayCoords {
+    const float* f32;
+    const double* f64;
+
+    explicit OCCTRT_RayCoords(PyArrayObject* theArray)
+    : f32(PyArray_TYPE(theArray) == NPY_FLOAT32 ? (const float*)PyArray_DATA(theArray) : NULL),
+      f64(PyArray_TYPE(theArray) == NPY_FLOAT32 ? NULL : (const double*)PyArray_DATA(theArray)) {}
+
+    double operator[](npy_intp theIndex) const {
+        return f32 ? (double)f32[theIndex] : f64[theIndex];
+    }
+};
+
+/* Output buffers for one ray batch. normals/uvs/ws are NULL unless normals
+ * are computed, the curvature buffers are NULL unless curvatures are. */
+struct OCCTRT_RayOutputs {
+    npy_bool* hits;
+    double* points;
+    int32_t* face_ids;
+    double* normals;
+    double* uvs;
+    double* ws;
+    double* gauss_curv;
+    double* mean_curv;
+    double* min_curv;
+    double* max_curv;
+};
+
+/* output_mode: "basic" (hits, points, face_ids),
+ *              "normals" (+ normals, uvs, ws),
+ *              "full" (+ curvatures)
+ * Unknown modes fall back to "normals". */
+static void OCCTRT_ParseOutputMode(const char* theMode, bool& theNormals, bool& theCurvatures)
+{
+    theNormals = true;
+    theCurvatures = false;
+
+    if (strcmp(theMode, "basic") == 0) {
+        theNormals = false;
+    } else if (strcmp(theMode, "full") == 0) {
+        theCurvatures = true;
+    }
+}
+
+/* Convert origins/directions to (N, 3) ray buffers. On failure a Python
+ * error is set, nothing is left to release and false is returned. */
+static bool OCCTRT_RayInputs(PyObject* theOriginsObj, PyObject* theDirectionsObj,
+                             PyArrayObject*& theOrigins, PyArrayObject*& theDirections,
+                             npy_intp& theNbRays)
+{
+    // float32 and float64 are read without conversion
+    theOrigins = OCCTRT_RayArray(theOriginsObj);
+    theDirections = OCCTRT_RayArray(theDirectionsObj);
+
+    const char* anError = NULL;
+    if (!theOrigins || !theDirections) {
+        anError = "origins and directions must be numpy arrays";
+    } else if (PyArray_NDIM(theOrigins) != 2 || PyArray_NDIM(theDirections) != 2) {
+        anError = "origins and directions must be 2D arrays (N x 3)";
+    } else if (PyArray_DIM(theOrigins, 1) != 3 || PyArray_DIM(theDirections, 1) != 3) {
+        anError = "Second dimension must be 3 (x, y, z)";
+    } else if (PyArray_DIM(theDirections, 0) != PyArray_DIM(theOrigins, 0)) {
+        anError = "origins and directions must have same number of rows";
+    }
+
+    if (anError) {
+        Py_XDECREF(theOrigins);
+        Py_XDECREF(theDirections);
+        theOrigins = NULL;
+        theDirections = NULL;
+        PyErr_SetString(PyExc_ValueError, anError);
+        return false;
+    }
+
+    theNbRays = PyArray_DIM(theOrigins, 0);
+    return true;
+}
+
+/* Data pointer of out[theKey], which must be a writeable C-contiguous array
+ * of theType with theSize elements. Sets a Python error and returns NULL
+ * otherwise. */
+static void* OCCTRT_OutBuffer(PyObject* theOut, const char* theKey, int theType, npy_intp theSize)
+{
+    PyObject* anObj = PyDict_GetItemString(theOut, theKey);  // borrowed
+    if (!anObj || !PyArray_Check(anObj)) {
+        PyErr_Format(PyExc_ValueError, "out['%s'] must be a numpy array", theKey);
+        return NULL;
+    }
+
+    PyArrayObject* anArray = (PyArrayObject*)anObj;
+    if (PyArray_TYPE(anArray) != theType || !PyArray_ISCARRAY(anArray) || PyArray_SIZE(anArray) != theSize) {
+        PyErr_Format(PyExc_ValueError,
+                     "out['%s'] must be a writeable C-contiguous %s array with %zd elements",
+                     theKey, theType == NPY_BOOL ? "bool" : (theType == NPY_INT32 ? "int32" : "float64"),
+                     (Py_ssize_t)theSize);
+        return NULL;
+    }
+    return PyArray_DATA(anArray);
+}
+
+/* Cast theNbRays rays and write every result into theOut.
+ * theCoherent: all rays share direction 0 (e.g. an orthographic grid);
+ *              the direction is normalized once and only the origin of
+ *              the line is updated per ray */
+static void OCCTRT_CastRays(BRepIntCurveSurface_InterBVH* theRT,
+                            const OCCTRT_RayCoords& orig_data,
+                            const OCCTRT_RayCoords& dir_data,
+                            npy_intp n_rays,
+                            bool theCoherent,
+                            const OCCTRT_RayOutputs& theOut)
+{
+    const bool compute_normals = theOut.normals != NULL;
+    const bool compute_curvatures = theOut.gauss_curv != NULL;
+
+    // Shared line for coherent batches (direction built once)
+    gp_Lin coherent_ray;
+    if (theCoherent && n_rays > 0) {
+        coherent_ray = gp_Lin(gp_Pnt(orig_data[0], orig_data[1], orig_data[2]),
+                              gp_Dir(dir_data[0], dir_data[1], dir_data[2]));
+    }
+
+    // Embree recommends FTZ/DAZ so denormals do not stall ray-box and
+    // ray-triangle tests; restored when the guard goes out of scope
+    OCCTRT_DenormalGuard denormal_guard(theRT->GetBackend() != BRepIntCurveSurface_BVHBackend::OCCT_BVH);
+
+    // Perform raycasting. This loop stays serial: Perform() stores its
+    // hits on theRT (IsDone/NbPnt/Pnt...), so iterations cannot share the
+    // instance across OpenMP threads without a per-thread result API.
+    for (npy_intp i = 0; i < n_rays; i++) {
+        gp_Pnt origin(orig_data[i*3], orig_data[i*3+1], orig_data[i*3+2]);
+
+        if (theCoherent) {
+            coherent_ray.SetLocation(origin);
+            theRT->Perform(coherent_ray);
+        } else {
+            gp_Dir direction(dir_data[i*3], dir_data[i*3+1], dir_data[i*3+2]);
+            theRT->Perform(gp_Lin(origin, direction));
+        }
+
+        if (theRT->IsDone() && theRT->NbPnt() > 0) {
+            theOut.hits[i] = 1;
+
+            gp_Pnt p = theRT->Pnt(1);
+            theOut.points[i*3] = p.X();
+            theOut.points[i*3+1] = p.Y();
+            theOut.points[i*3+2] = p.Z();
+
+            theOut.face_ids[i] = theRT->FaceIndex(1);
+
+            if (compute_normals) {
+                gp_Dir n = theRT->Normal(1);
+                theOut.normals[i*3] = n.X();
+                theOut.normals[i*3+1] = n.Y();
+                theOut.normals[i*3+2] = n.Z();
+                theOut.uvs[i*2] = theRT->U(1);
+                theOut.uvs[i*2+1] = theRT->V(1);
+                theOut.ws[i] = theRT->W(1);
+            }
+
+            if (compute_curvatures) {
+                theOut.gauss_curv[i] = theRT->GaussianCurvature(1);
+                theOut.mean_curv[i] = theRT->MeanCurvature(1);
+                theOut.min_curv[i] = theRT->MinCurvature(1);
+                theOut.max_curv[i] = theRT->MaxCurvature(1);
+            }
+        } else {
+            theOut.hits[i] = 0;
+            theOut.points[i*3] = 0;
+            theOut.points[i*3+1] = 0;
+            theOut.points[i*3+2] = 0;
+            theOut.face_ids[i] = -1;
+
+            if (compute_normals) {
+                theOut.normals[i*3] = 0;
+                theOut.normals[i*3+1] = 0;
+                theOut.normals[i*3+2] = 1;
+                theOut.uvs[i*2] = 0;
+                theOut.uvs[i*2+1] = 0;
+                theOut.ws[i] = 0;
+            }
+
+            if (compute_curvatures) {
+                theOut.gauss_curv[i] = 0;
+                theOut.mean_curv[i] = 0;
+                theOut.min_curv[i] = 0;
+                theOut.max_curv[i] = 0;
+            }
+        }
+    }
+}
 %}
 
 /* Initialize NumPy */
@@ -266,90 +519,81 @@ public:
 
     /* Cast multiple rays and return NumPy arrays
      * output_mode: "basic" (hits, points, face_ids),
-     *              "normals" (+ normals),
+     *              "normals" (+ normals, uvs, ws),
      *              "full" (+ curvatures)
+     * coherent: all rays share directions[0] (e.g. an orthographic grid);
+     *           the direction is normalized once and only the origin
+     *           of the line is updated per ray. Other directions are not
+     *           checked, only read
      */
-    PyObject* cast_rays_numpy(PyObject* origins_obj, PyObject* directions_obj, const char* output_mode = "normals") {
+    PyObject* cast_rays_numpy(PyObject* origins_obj, PyObject* directions_obj, const char* output_mode = "normals",
+                              bool coherent = false) {
         // Parse output mode
-        bool compute_normals = true;
-        bool compute_curvatures = false;
-
-        if (strcmp(output_mode, "basic") == 0) {
-            compute_normals = false;
-            compute_curvatures = false;
-        } else if (strcmp(output_mode, "normals") == 0) {
-            compute_normals = true;
-            compute_curvatures = false;
-        } else if (strcmp(output_mode, "full") == 0) {
-            compute_normals = true;
-            compute_curvatures = true;
-        }
+        bool compute_normals, compute_curvatures;
+        OCCTRT_ParseOutputMode(output_mode, compute_normals, compute_curvatures);
 
         // Validate inputs
-        PyArrayObject* origins = (PyArrayObject*)PyArray_FROM_OTF(origins_obj, NPY_FLOAT64, NPY_ARRAY_IN_ARRAY);
-        PyArrayObject* directions = (PyArrayObject*)PyArray_FROM_OTF(directions_obj, NPY_FLOAT64, NPY_ARRAY_IN_ARRAY);
-
-        if (!origins || !directions) {
-            Py_XDECREF(origins);
-            Py_XDECREF(directions);
-            PyErr_SetString(PyExc_ValueError, "origins and directions must be numpy arrays");
-            return NULL;
-        }
-
-        // Check dimensions
-        if (PyArray_NDIM(origins) != 2 || PyArray_NDIM(directions) != 2) {
-            Py_DECREF(origins);
-            Py_DECREF(directions);
-            PyErr_SetString(PyExc_ValueError, "origins and directions must be 2D arrays (N x 3)");
-            return NULL;
-        }
-
-        npy_intp n_rays = PyArray_DIM(origins, 0);
-        if (PyArray_DIM(origins, 1) != 3 || PyArray_DIM(directions, 1) != 3) {
-            Py_DECREF(origins);
-            Py_DECREF(directions);
-            PyErr_SetString(PyExc_ValueError, "Second dimension must be 3 (x, y, z)");
+        PyArrayObject* origins;
+        PyArrayObject* directions;
+        npy_intp n_rays;
+        if (!OCCTRT_RayInputs(origins_obj, directions_obj, origins, directions, n_rays)) {
             return NULL;
         }
 
-        if (PyArray_DIM(directions, 0) != n_rays) {
-            Py_DECREF(origins);
-            Py_DECREF(directions);
-            PyErr_SetString(PyExc_ValueError, "origins and directions must have same number of rows");
-            return NULL;
-        }
-
-        // Get data pointers
-        double* orig_data = (double*)PyArray_DATA(origins);
-        double* dir_data = (double*)PyArray_DATA(directions);
-
         // Create output arrays (always allocated)
         npy_intp dims_n = n_rays;
+        npy_intp dims_n2[2] = {n_rays, 2};
         npy_intp dims_n3[2] = {n_rays, 3};
 
         PyArrayObject* hits = (PyArrayObject*)PyArray_SimpleNew(1, &dims_n, NPY_BOOL);
-        PyArrayObject* points = (PyArrayObject*)PyArray_SimpleNew(2, dims_n3, NPY_FLOAT64);
         PyArrayObject* face_ids = (PyArrayObject*)PyArray_SimpleNew(1, &dims_n, NPY_INT32);
 
-        // Conditionally allocated arrays
+        // All float64 outputs live in one block, laid out as consecutive
+        // arrays [points | normals | uvs | ws | curvatures...]; the returned
+        // arrays are contiguous views that keep the block alive, so holding
+        // any one of them holds all of them (documented on cast_rays)
+        npy_intp n_block = n_rays * (3 + (compute_normals ? 6 : 0) + (compute_curvatures ? 4 : 0));
+        PyArrayObject* block = (PyArrayObject*)PyArray_SimpleNew(1, &n_block, NPY_FLOAT64);
+
+        PyArrayObject* points = NULL;
         PyArrayObject* normals = NULL;
+        PyArrayObject* uvs = NULL;
+        PyArrayObject* ws = NULL;
         PyArrayObject* gauss_curv = NULL;
         PyArrayObject* mean_curv = NULL;
         PyArrayObject* min_curv = NULL;
         PyArrayObject* max_curv = NULL;
 
-        if (compute_normals) {
-            normals = (PyArrayObject*)PyArray_SimpleNew(2, dims_n3, NPY_FLOAT64);
-        }
-        if (compute_curvatures) {
-            gauss_curv = (PyArrayObject*)PyArray_SimpleNew(1, &dims_n, NPY_FLOAT64);
-            mean_curv = (PyArrayObject*)PyArray_SimpleNew(1, &dims_n, NPY_FLOAT64);
-            min_curv = (PyArrayObject*)PyArray_SimpleNew(1, &dims_n, NPY_FLOAT64);
-            max_curv = (PyArrayObject*)PyArray_SimpleNew(1, &dims_n, NPY_FLOAT64);
+        if (block) {
+            npy_intp offset = 0;
+            points = OCCTRT_BlockView(block, offset, 2, dims_n3);
+            offset += n_rays * 3;
+
+            if (compute_normals) {
+                normals = OCCTRT_BlockView(block, offset, 2, dims_n3);
+                offset += n_rays * 3;
+                uvs = OCCTRT_BlockView(block, offset, 2, dims_n2);
+                offset += n_rays * 2;
+                ws = OCCTRT_BlockView(block, offset, 1, &dims_n);
+                offset += n_rays;
+            }
+            if (compute_curvatures) {
+                gauss_curv = OCCTRT_BlockView(block, offset, 1, &dims_n);
+                offset += n_rays;
+                mean_curv = OCCTRT_BlockView(block, offset, 1, &dims_n);
+                offset += n_rays;
+                min_curv = OCCTRT_BlockView(block, offset, 1, &dims_n);
+                offset += n_rays;
+                max_curv = OCCTRT_BlockView(block, offset, 1, &dims_n);
+                offset += n_rays;
+            }
         }
 
+        // The views hold their own references to the block
+        Py_XDECREF(block);
+
         if (!hits || !points || !face_ids ||
-            (compute_normals && !normals) ||
+            (compute_normals && (!normals || !uvs || !ws)) ||
             (compute_curvatures && (!gauss_curv || !mean_curv || !min_curv || !max_curv))) {
             Py_DECREF(origins);
             Py_DECREF(directions);
@@ -357,6 +601,8 @@ public:
             Py_XDECREF(points);
             Py_XDECREF(face_ids);
             Py_XDECREF(normals);
+            Py_XDECREF(uvs);
+            Py_XDECREF(ws);
             Py_XDECREF(gauss_curv);
             Py_XDECREF(mean_curv);
             Py_XDECREF(min_curv);
@@ -365,67 +611,19 @@ public:
             return NULL;
         }
 
-        npy_bool* hits_data = (npy_bool*)PyArray_DATA(hits);
-        double* points_data = (double*)PyArray_DATA(points);
-        int32_t* face_ids_data = (int32_t*)PyArray_DATA(face_ids);
-        double* normals_data = compute_normals ? (double*)PyArray_DATA(normals) : NULL;
-        double* gauss_data = compute_curvatures ? (double*)PyArray_DATA(gauss_curv) : NULL;
-        double* mean_data = compute_curvatures ? (double*)PyArray_DATA(mean_curv) : NULL;
-        double* min_data = compute_curvatures ? (double*)PyArray_DATA(min_curv) : NULL;
-        double* max_data = compute_curvatures ? (double*)PyArray_DATA(max_curv) : NULL;
-
-        // Perform raycasting
-        for (npy_intp i = 0; i < n_rays; i++) {
-            gp_Pnt origin(orig_data[i*3], orig_data[i*3+1], orig_data[i*3+2]);
-            gp_Dir direction(dir_data[i*3], dir_data[i*3+1], dir_data[i*3+2]);
-            gp_Lin ray(origin, direction);
-
-            $self->Perform(ray);
-
-            if ($self->IsDone() && $self->NbPnt() > 0) {
-                hits_data[i] = 1;
-
-                gp_Pnt p = $self->Pnt(1);
-                points_data[i*3] = p.X();
-                points_data[i*3+1] = p.Y();
-                points_data[i*3+2] = p.Z();
-
-                face_ids_data[i] = $self->FaceIndex(1);
-
-                if (compute_normals) {
-                    gp_Dir n = $self->Normal(1);
-                    normals_data[i*3] = n.X();
-                    normals_data[i*3+1] = n.Y();
-                    normals_data[i*3+2] = n.Z();
-                }
-
-                if (compute_curvatures) {
-                    gauss_data[i] = $self->GaussianCurvature(1);
-                    mean_data[i] = $self->MeanCurvature(1);
-                    min_data[i] = $self->MinCurvature(1);
-                    max_data[i] = $self->MaxCurvature(1);
-                }
-            } else {
-                hits_data[i] = 0;
-                points_data[i*3] = 0;
-                points_data[i*3+1] = 0;
-                points_data[i*3+2] = 0;
-                face_ids_data[i] = -1;
-
-                if (compute_normals) {
-                    normals_data[i*3] = 0;
-                    normals_data[i*3+1] = 0;
-                    normals_data[i*3+2] = 1;
-                }
-
-                if (compute_curvatures) {
-                    gauss_data[i] = 0;
-                    mean_data[i] = 0;
-                    min_data[i] = 0;
-                    max_data[i] = 0;
-                }
-            }
-        }
+        OCCTRT_RayOutputs out;
+        out.hits = (npy_bool*)PyArray_DATA(hits);
+        out.points = (double*)PyArray_DATA(points);
+        out.face_ids = (int32_t*)PyArray_DATA(face_ids);
+        out.normals = compute_normals ? (double*)PyArray_DATA(normals) : NULL;
+        out.uvs = compute_normals ? (double*)PyArray_DATA(uvs) : NULL;
+        out.ws = compute_normals ? (double*)PyArray_DATA(ws) : NULL;
+        out.gauss_curv = compute_curvatures ? (double*)PyArray_DATA(gauss_curv) : NULL;
+        out.mean_curv = compute_curvatures ? (double*)PyArray_DATA(mean_curv) : NULL;
+        out.min_curv = compute_curvatures ? (double*)PyArray_DATA(min_curv) : NULL;
+        out.max_curv = compute_curvatures ? (double*)PyArray_DATA(max_curv) : NULL;
+
+        OCCTRT_CastRays($self, OCCTRT_RayCoords(origins), OCCTRT_RayCoords(directions), n_rays, coherent, out);
 
         Py_DECREF(origins);
         Py_DECREF(directions);
@@ -442,7 +640,11 @@ public:
 
         if (compute_normals) {
             PyDict_SetItemString(result, "normals", (PyObject*)normals);
+            PyDict_SetItemString(result, "uvs", (PyObject*)uvs);
+            PyDict_SetItemString(result, "ws", (PyObject*)ws);
             Py_DECREF(normals);
+            Py_DECREF(uvs);
+            Py_DECREF(ws);
         }
 
         if (compute_curvatures) {
@@ -458,4 +660,61 @@ public:
 
         return result;
     }
+
+    /* Cast multiple rays into caller-provided NumPy arrays and return out.
+     * out must hold the arrays cast_rays_numpy would return for output_mode
+     * ("hits" bool[N], "points" float64[N,3], "face_ids" int32[N], ...),
+     * each writeable and C-contiguous. Nothing is allocated per call.
+     */
+    PyObject* cast_rays_numpy_into(PyObject* origins_obj, PyObject* directions_obj, PyObject* out_obj,
+                                   const char* output_mode = "normals", bool coherent = false) {
+        // Parse output mode
+        bool compute_normals, compute_curvatures;
+        OCCTRT_ParseOutputMode(output_mode, compute_normals, compute_curvatures);
+
+        if (!PyDict_Check(out_obj)) {
+            PyErr_SetString(PyExc_TypeError, "out must be a dict of numpy arrays");
+            return NULL;
+        }
+
+        // Validate inputs
+        PyArrayObject* origins;
+        PyArrayObject* directions;
+        npy_intp n_rays;
+        if (!OCCTRT_RayInputs(origins_obj, directions_obj, origins, directions, n_rays)) {
+            return NULL;
+        }
+
+        // Validate outputs
+        OCCTRT_RayOutputs out = {};
+        bool valid = (out.hits = (npy_bool*)OCCTRT_OutBuffer(out_obj, "hits", NPY_BOOL, n_rays)) != NULL
+                  && (out.points = (double*)OCCTRT_OutBuffer(out_obj, "points", NPY_FLOAT64, n_rays * 3)) != NULL
+                  && (out.face_ids = (int32_t*)OCCTRT_OutBuffer(out_obj, "face_ids", NPY_INT32, n_rays)) != NULL;
+
+        if (valid && compute_normals) {
+            valid = (out.normals = (double*)OCCTRT_OutBuffer(out_obj, "normals", NPY_FLOAT64, n_rays * 3)) != NULL
+                 && (out.uvs = (double*)OCCTRT_OutBuffer(out_obj, "uvs", NPY_FLOAT64, n_rays * 2)) != NULL
+                 && (out.ws = (double*)OCCTRT_OutBuffer(out_obj, "ws", NPY_FLOAT64, n_rays)) != NULL;
+        }
+        if (valid && compute_curvatures) {
+            valid = (out.gauss_curv = (double*)OCCTRT_OutBuffer(out_obj, "gauss_curvatures", NPY_FLOAT64, n_rays)) != NULL
+                 && (out.mean_curv = (double*)OCCTRT_OutBuffer(out_obj, "mean_curvatures", NPY_FLOAT64, n_rays)) != NULL
+                 && (out.min_curv = (double*)OCCTRT_OutBuffer(out_obj, "min_curvatures", NPY_FLOAT64, n_rays)) != NULL
+                 && (out.max_curv = (double*)OCCTRT_OutBuffer(out_obj, "max_curvatures", NPY_FLOAT64, n_rays)) != NULL;
+        }
+
+        if (!valid) {
+            Py_DECREF(origins);
+            Py_DECREF(directions);
+            return NULL;
+        }
+
+        OCCTRT_CastRays($self, OCCTRT_RayCoords(origins), OCCTRT_RayCoords(directions), n_rays, coherent, out);
+
+        Py_DECREF(origins);
+        Py_DECREF(directions);
+
+        Py_INCREF(out_obj);
+        return out_obj;
+    }
 }
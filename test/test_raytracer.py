@@ -98,6 +98,56 @@ class TestRaytracer:
         )
 
         assert result["hit"] is False
+        assert "hit" in result
+        assert "point" not in result
+        assert result.get("point") is None
+        assert result.asdict() == {"hit": False}
+
+    def test_hit_dict_access(self, sphere_shape):
+        """Test that Hit keeps dict-style access and asdict() for old callers."""
+        from occt_rt import Raytracer
+
+        rt = Raytracer(sphere_shape, deflection=0.1)
+        result = rt.cast_ray(origin=(0, 0, 100), direction=(0, 0, -1))
+
+        assert result["hit"] is result.hit
+        assert result["face_id"] == result.face_id
+        assert result[0] is True
+
+        # Curvatures were not requested, so they are absent like in the old dict
+        assert "gauss_curvature" not in result
+        assert result.get("gauss_curvature", 0.0) == 0.0
+        with pytest.raises(KeyError):
+            result["gauss_curvature"]
+        with pytest.raises(KeyError):
+            result["not_a_field"]
+        assert set(result.keys()) == {"hit", "point", "normal", "uv", "w", "face_id"}
+        assert dict(result.items()).keys() == result.keys()
+
+        curved = rt.cast_ray(origin=(0, 0, 100), direction=(0, 0, -1), include_curvatures=True)
+        assert "gauss_curvature" in curved
+        assert curved.get("gauss_curvature") == curved.gauss_curvature
+
+        as_dict = result.asdict()
+        assert set(as_dict) == {"hit", "point", "normal", "uv", "w", "face_id"}
+        np.testing.assert_allclose(as_dict["point"], result.point)
+
+    def test_single_ray_matches_legacy(self, sphere_shape):
+        """Test that the batch-backed cast_ray agrees with the gp_Lin path."""
+        from occt_rt import Raytracer
+
+        rt = Raytracer(sphere_shape, deflection=0.1)
+
+        fast = rt.cast_ray(origin=(10, 5, 100), direction=(0, 0, -1))
+        legacy = rt.cast_ray(origin=(10, 5, 100), direction=(0, 0, -1), legacy=True)
+
+        assert fast["hit"] is True
+        assert legacy["hit"] is True
+        np.testing.assert_allclose(fast["point"], legacy["point"])
+        np.testing.assert_allclose(fast["normal"], legacy["normal"])
+        np.testing.assert_allclose(fast["uv"], legacy["uv"])
+        assert abs(fast["w"] - legacy["w"]) < 1e-9
+        assert fast["face_id"] == legacy["face_id"]
 
     def test_batch_rays(self, sphere_shape):
         """Test casting multiple rays in batch."""
@@ -128,6 +178,62 @@ class TestRaytracer:
         assert n_hits > 0
         assert n_hits < n * n
 
+    def test_batch_rays_into(self, sphere_shape):
+        """Test that cast_rays_into fills and reuses the given buffers."""
+        from occt_rt import Raytracer
+
+        rt = Raytracer(sphere_shape, deflection=0.1)
+
+        origins = np.array([[0.0, 0.0, 100.0], [10.0, 0.0, 100.0], [200.0, 0.0, 100.0]])
+        directions = np.tile([0.0, 0.0, -1.0], (3, 1))
+
+        expected = rt.cast_rays(origins, directions)
+        out = rt.cast_rays_into(origins, directions)
+        points = out["points"]
+
+        assert set(out) == set(expected)
+        np.testing.assert_array_equal(out["hits"], expected["hits"])
+        np.testing.assert_allclose(out["points"], expected["points"])
+
+        # Second call writes into the same arrays
+        again = rt.cast_rays_into(origins + [1.0, 0.0, 0.0], directions, out=out)
+        assert again is out
+        assert out["points"] is points
+        assert out["hits"][0]
+
+        with pytest.raises(ValueError):
+            rt.cast_rays_into(origins[:2], directions[:2], out=out)
+
+    def test_render_matches_cast_rays(self, sphere_shape):
+        """Test that the coherent render path matches per-ray direction setup."""
+        from occt_rt import Raytracer
+
+        rt = Raytracer(sphere_shape, deflection=0.1)
+
+        width, height = 12, 10
+        image = rt.render_orthographic(
+            resolution=(width, height),
+            bounds=(-60, -60, 60, 60),
+            axis="z",
+            offset=100,
+        )
+
+        xx, yy = np.meshgrid(np.linspace(-60, 60, width), np.linspace(60, -60, height))
+        origins = np.column_stack([xx.ravel(), yy.ravel(), np.full(width * height, 100.0)])
+        directions = np.tile([0.0, 0.0, -1.0], (width * height, 1))
+        results = rt.cast_rays(origins, directions)
+
+        hits = results["hits"].reshape(height, width)
+        np.testing.assert_array_equal(~np.isnan(image["depth"]), hits)
+        np.testing.assert_allclose(
+            image["depth"][hits], results["points"][:, 2].reshape(height, width)[hits], rtol=1e-6
+        )
+        np.testing.assert_array_equal(image["face_ids"], results["face_ids"].reshape(height, width))
+
+        # The shared-direction shortcut is internal only
+        with pytest.raises(TypeError):
+            rt.cast_rays(origins, directions, coherent=True)
+
     def test_render_orthographic(self, box_shape):
         """Test orthographic rendering."""
         from occt_rt import Raytracer
@@ -154,6 +260,133 @@ class TestRaytracer:
         hit_depths = depth[valid_hits]
         assert np.max(hit_depths) > 25
 
+    def test_clear_render_buffers(self, box_shape):
+        """Test that render buffers are reused and can be released."""
+        from occt_rt import Raytracer
+
+        rt = Raytracer(box_shape, deflection=0.05)
+        kwargs = dict(resolution=(16, 16), bounds=(-5, -10, 15, 30), axis="z", offset=50)
+
+        first = rt.render_orthographic(**kwargs)
+        scratch = rt._render_scratch
+        rt.render_orthographic(**kwargs)
+        assert rt._render_scratch is scratch
+
+        rt.clear_render_buffers()
+        assert rt._render_scratch is None
+        again = rt.render_orthographic(**kwargs)
+        np.testing.assert_array_equal(again["face_ids"], first["face_ids"])
+
+    @pytest.mark.parametrize(
+        "axis, depth_axis, face_depth, face_size",
+        [
+            ("x", 0, 10.0, (20.0, 30.0)),  # image (y, z), +X face at x = 10
+            ("y", 1, 20.0, (10.0, 30.0)),  # image (x, z), +Y face at y = 20
+        ],
+    )
+    def test_render_orthographic_side_axes(self, box_shape, axis, depth_axis, face_depth, face_size):
+        """Test that side views map image axes to the right world axes."""
+        from occt_rt import Raytracer
+
+        rt = Raytracer(box_shape, deflection=0.05)
+
+        # Sample spacing chosen so no ray runs exactly along a box edge
+        width, height = 40, 50
+        image = rt.render_orthographic(
+            resolution=(width, height),
+            bounds=(-5, -5, 35, 45),
+            axis=axis,
+            offset=50,
+        )
+        depth = image["depth"]
+        hits = ~np.isnan(depth)
+
+        xs = np.linspace(-5, 35, width)
+        ys = np.linspace(45, -5, height)
+        expected = ((ys >= 0) & (ys <= face_size[1]))[:, None] & ((xs >= 0) & (xs <= face_size[0]))
+        np.testing.assert_array_equal(hits, expected)
+
+        np.testing.assert_allclose(depth[hits], face_depth, atol=1e-4)
+        outward = np.zeros(3)
+        outward[depth_axis] = 1.0
+        np.testing.assert_allclose(image["normals"][hits], np.broadcast_to(outward, (hits.sum(), 3)), atol=1e-6)
+
+    def test_bvh_cache_reused(self, sphere_shape):
+        """Test that identical settings reuse the cached BVH build."""
+        from occt_rt import Raytracer
+
+        rt_a = Raytracer(sphere_shape, deflection=0.1)
+        rt_b = Raytracer(sphere_shape, deflection=0.1)
+        rt_c = Raytracer(sphere_shape, deflection=0.1, force_remesh=True)
+
+        assert rt_a._rt is rt_b._rt
+        assert rt_c._rt is not rt_a._rt
+
+    def test_bvh_cache_key_independent_of_call(self, sphere_shape):
+        """Test that cache lookups agree however the build is requested."""
+        from occt_rt import Raytracer
+        from occt_rt.raytracer import _BACKEND_MAP, _get_build
+
+        rt = Raytracer(sphere_shape, deflection=0.1)
+        assert _get_build(sphere_shape, 0.001, 0.1, _BACKEND_MAP["occt"], True) is rt._rt
+        assert _get_build(sphere_shape, 0.001, 0.1, _BACKEND_MAP["occt"], True, False) is rt._rt
+
+    def test_bvh_cache_backend_aliases(self, sphere_shape):
+        """Test that backend aliases share a build and clear_cache drops it."""
+        from occt_rt import Raytracer, clear_cache
+
+        try:
+            rt_a = Raytracer(sphere_shape, backend="embree")
+        except RuntimeError:
+            pytest.skip("Embree not compiled in")
+        rt_b = Raytracer(sphere_shape, backend="embree_scalar")
+        assert rt_a._rt is rt_b._rt
+        assert rt_b.backend == "embree_scalar"
+
+        embree_build = rt_a._rt
+        rt_a.set_backend("embree_scalar")
+        assert rt_a._rt is embree_build
+        assert rt_a.backend == "embree_scalar"
+
+        clear_cache()
+        rt_c = Raytracer(sphere_shape, backend="embree")
+        assert rt_c._rt is not embree_build
+
+    def test_existing_tessellation_kept(self, sphere_shape):
+        """Test that meshing is skipped unless the mesh is too coarse or force_remesh is set."""
+        from OCC.Core.BRep import BRep_Tool
+        from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+        from OCC.Core.TopAbs import TopAbs_FACE
+        from OCC.Core.TopExp import TopExp_Explorer
+        from OCC.Core.TopLoc import TopLoc_Location
+        from OCC.Core.TopoDS import topods
+        from occt_rt import Raytracer
+
+        def mesh_state():
+            face = topods.Face(TopExp_Explorer(sphere_shape, TopAbs_FACE).Current())
+            triangulation = BRep_Tool.Triangulation(face, TopLoc_Location())
+            return triangulation.Deflection(), triangulation.NbTriangles()
+
+        BRepMesh_IncrementalMesh(sphere_shape, 0.1)
+        meshed = mesh_state()
+
+        # Equal or coarser deflection keeps the existing triangulation
+        Raytracer(sphere_shape, deflection=0.1, force_remesh=False)
+        Raytracer(sphere_shape, deflection=1.0)
+        assert mesh_state() == meshed
+
+        # force_remesh replaces it, even at a coarser deflection
+        Raytracer(sphere_shape, deflection=1.0, force_remesh=True)
+        coarse = mesh_state()
+        assert coarse != meshed
+        assert coarse[1] < meshed[1]
+
+        # A finer deflection than the current mesh re-tessellates
+        Raytracer(sphere_shape, deflection=0.05)
+        fine = mesh_state()
+        assert fine[0] <= 0.05
+        assert fine[1] > meshed[1]
+
     def test_different_backends(self, sphere_shape):
         """Test creating raytracers with different backends."""
         from occt_rt import Raytracer
@@ -169,6 +402,82 @@ class TestRaytracer:
         except RuntimeError:
             pass  # Embree not compiled in
 
+    def test_set_backend(self, sphere_shape):
+        """Test switching backends on an existing raytracer."""
+        from occt_rt import Raytracer
+
+        rt = Raytracer(sphere_shape, backend="occt")
+        occt_build = rt._rt
+
+        try:
+            rt.set_backend("embree")
+        except RuntimeError:
+            pytest.skip("Embree not compiled in")
+        assert rt.backend == "embree"
+        assert rt.cast_ray(origin=(0, 0, 100), direction=(0, 0, -1)).hit
+
+        # Switching back reuses the cached OCCT build
+        rt.set_backend("occt")
+        assert rt.backend == "occt"
+        assert rt._rt is occt_build
+
+        with pytest.raises(ValueError):
+            rt.set_backend("not_a_backend")
+
+    def test_float32_precision_fallback(self, sphere_shape):
+        """Test that far-away rays on Embree warn and use the OCCT build."""
+        from occt_rt import Raytracer
+
+        try:
+            rt = Raytracer(sphere_shape, backend="embree")
+        except RuntimeError:
+            pytest.skip("Embree not compiled in")
+
+        with pytest.warns(RuntimeWarning, match="float32 precision"):
+            result = rt.cast_ray(origin=(0, 0, 1e6), direction=(0, 0, -1))
+
+        assert result.hit is True
+        assert abs(result.point[2] - 50.0) < 0.1
+        assert rt.backend == "embree"
+
+        # The fallback shares the build of an OCCT raytracer for the same shape
+        rt_occt = Raytracer(sphere_shape, backend="occt")
+        with pytest.warns(RuntimeWarning, match="float32 precision"):
+            assert rt._rt_for_extent(1e6) is rt_occt._rt
+
+    def test_weakref(self, sphere_shape):
+        """Test that a raytracer can be referenced weakly."""
+        import weakref
+
+        from occt_rt import Raytracer
+
+        rt = Raytracer(sphere_shape)
+        ref = weakref.ref(rt)
+        assert ref() is rt
+
+    def test_float32_precision_fallback_far_shape(self):
+        """Test that geometry far from the origin triggers the fallback too."""
+        from occt_rt import Raytracer
+
+        try:
+            from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeSphere
+            from OCC.Core.gp import gp_Pnt
+        except ImportError:
+            pytest.skip("pythonocc-core not installed")
+
+        far_sphere = BRepPrimAPI_MakeSphere(gp_Pnt(1e6, 0, 0), 50.0).Shape()
+        try:
+            rt = Raytracer(far_sphere, backend="embree")
+        except RuntimeError:
+            pytest.skip("Embree not compiled in")
+
+        # The ray starts at the origin, so only the shape is far out
+        with pytest.warns(RuntimeWarning, match="float32 precision"):
+            result = rt.cast_ray(origin=(0, 0, 0), direction=(1, 0, 0))
+
+        assert result.hit is True
+        assert abs(result.point[0] - (1e6 - 50.0)) < 0.1
+
     def test_repr(self, sphere_shape):
         """Test string representation."""
         from occt_rt import Raytracer